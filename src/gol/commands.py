@@ -13,7 +13,7 @@ from gol.controller import (
     resize_game,
 )
 from gol.grid import BoundaryCondition, create_grid
-from gol.patterns import BUILTIN_PATTERNS, FilePatternStorage, place_pattern
+from gol.patterns import BUILTIN_PATTERNS, default_storage, place_pattern
 from gol.renderer import RendererConfig, RendererState, TerminalProtocol
 from gol.types import CommandType, Grid
 
@@ -163,7 +163,7 @@ def handle_place_pattern(
 
     pattern = BUILTIN_PATTERNS.get(
         config.renderer.selected_pattern
-    ) or FilePatternStorage().load_pattern(config.renderer.selected_pattern)
+    ) or default_storage().load_pattern(config.renderer.selected_pattern)
 
     if not pattern:
         return grid, config, render_state, False
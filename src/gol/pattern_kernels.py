@@ -0,0 +1,59 @@
+"""JIT-compiled kernels for pattern search."""
+
+import numpy as np
+from numba import njit, prange
+
+# Side of the square block of window positions scanned together. A 128x128
+# block of one-byte cells (plus the template-sized halo) stays within L1
+SEARCH_TILE = 128
+
+# Kernels are cached on disk so only the first process to use them pays the
+# compile cost; indices are derived from the array shapes, so bounds checks
+# are left off
+
+
+@njit(parallel=True, cache=True, boundscheck=False)
+def match_pattern_windows(
+    grid: np.ndarray, template: np.ndarray, probe_y: np.ndarray, probe_x: np.ndarray
+) -> np.ndarray:
+    """Marks every top-left position where the template matches the grid exactly.
+
+    Window positions are processed in square tiles so each tile's slice of the
+    grid stays cache resident; tiles are split across cores. Each window
+    checks template cells in probe order and stops at its first mismatch, so
+    putting the cells least likely to match first rejects most windows after
+    a single comparison.
+
+    Args:
+        grid: Contiguous boolean grid to search
+        template: Contiguous boolean pattern cells
+        probe_y: Row offsets of every template cell, in comparison order
+        probe_x: Column offsets matching probe_y
+
+    Returns:
+        Boolean array of shape (H - h + 1, W - w + 1) flagging matches
+    """
+    height, width = grid.shape
+    t_height, t_width = template.shape
+    out_height = max(height - t_height + 1, 0)
+    out_width = max(width - t_width + 1, 0)
+    matches = np.zeros((out_height, out_width), dtype=np.bool_)
+    n_probes = probe_y.shape[0]
+
+    tiles_y = (out_height + SEARCH_TILE - 1) // SEARCH_TILE
+    tiles_x = (out_width + SEARCH_TILE - 1) // SEARCH_TILE
+    for tile in prange(tiles_y * tiles_x):
+        y_start = (tile // tiles_x) * SEARCH_TILE
+        x_start = (tile % tiles_x) * SEARCH_TILE
+        for y in range(y_start, min(y_start + SEARCH_TILE, out_height)):
+            for x in range(x_start, min(x_start + SEARCH_TILE, out_width)):
+                is_match = True
+                for i in range(n_probes):
+                    dy = probe_y[i]
+                    dx = probe_x[i]
+                    if grid[y + dy, x + dx] != template[dy, dx]:
+                        is_match = False
+                        break
+                matches[y, x] = is_match
+
+    return matches
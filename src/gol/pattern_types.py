@@ -2,11 +2,12 @@
 
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import List, Optional
+from typing import Dict, Optional, Tuple, cast
 
 import numpy as np
+from numpy.typing import ArrayLike
 
-from .types import PatternGrid
+from .types import IntArray, PatternGrid
 
 
 class PatternCategory(Enum):
@@ -30,7 +31,7 @@ class PatternMetadata:
     author: Optional[str] = None
     oscillator_period: Optional[int] = None
     discovery_year: Optional[int] = None
-    tags: List[str] = field(default_factory=list)
+    tags: Tuple[str, ...] = ()
 
 
 @dataclass(frozen=True)
@@ -39,11 +40,68 @@ class Pattern:
 
     metadata: PatternMetadata
     cells: PatternGrid
+    # Live cell (xs, ys) arrays per rotation, filled on first use
+    _rot_cache: Dict[int, Tuple[IntArray, IntArray]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Contiguous rotated copies of cells keyed by clockwise quarter turns
+    _rotations: Dict[int, PatternGrid] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
-        """Ensures consistent numpy boolean array representation."""
+        """Ensures consistent numpy boolean array representation.
+
+        Boolean arrays are kept as given, without a copy, so views such as
+        those from extract_pattern(copy=False) stay views; anything else is
+        converted here to a C-contiguous array as a fallback. Prefer
+        from_cells for cell data that is not yet a bool array.
+        """
         if not isinstance(self.cells, np.ndarray) or self.cells.dtype != np.bool_:
-            object.__setattr__(self, "cells", np.array(self.cells, dtype=np.bool_))
+            cells = np.ascontiguousarray(self.cells, dtype=np.bool_)
+            object.__setattr__(self, "cells", cells)
+
+    @classmethod
+    def from_cells(cls, metadata: PatternMetadata, cells: ArrayLike) -> "Pattern":
+        """Creates a pattern from any array-like grid of truthy cells.
+
+        Args:
+            metadata: Pattern metadata
+            cells: Nested sequences or array of cell states, rows first
+
+        Returns:
+            Pattern whose cells are a C-contiguous boolean array
+
+        Raises:
+            ValueError: If cells are not two-dimensional
+        """
+        grid = np.ascontiguousarray(cells, dtype=np.bool_)
+        if grid.ndim != 2:
+            raise ValueError(f"Pattern cells must be 2-D, got shape {grid.shape}")
+        return cls(metadata=metadata, cells=cast(PatternGrid, grid))
+
+    @property
+    def _cacheable(self) -> bool:
+        """Whether data derived from cells may be memoized on this pattern.
+
+        Cells that view another array, such as extract_pattern(copy=False)
+        sections, change along with it, so nothing derived from them is
+        cached.
+        """
+        return self.cells.base is None
+
+    def rotated(self, turns: int) -> PatternGrid:
+        """Returns cells rotated clockwise by quarter turns, cached read-only."""
+        turns %= 4
+        cells = self._rotations.get(turns)
+        if cells is None:
+            cells = np.ascontiguousarray(np.rot90(self.cells, k=-turns))
+            if turns == 0 and cells is self.cells:
+                cells = cells.view()
+            cells.setflags(write=False)
+            if self._cacheable:
+                self._rotations[turns] = cells
+        return cells
 
     @property
     def width(self) -> int:
@@ -1,15 +1,23 @@
 """Pattern management for Game of Life."""
 
+import functools
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional, Protocol, cast
+from typing import Dict, List, Optional, Protocol, Tuple, cast
 
 import numpy as np
+from scipy import signal
 
+from .pattern_kernels import match_pattern_windows
 from .pattern_types import Pattern, PatternCategory, PatternMetadata
-from .rle_parser import parse_rle_pattern
-from .types import Grid, GridPosition, PatternGrid
+from .rle_parser import RLEDimensions, parse_pattern_data, parse_rle_pattern
+from .types import Grid, GridPosition, IntArray, PatternGrid, PositionArray
 
 
 class PatternTransform(Enum):
@@ -22,13 +30,26 @@ class PatternTransform(Enum):
 
     def next_rotation(self) -> "PatternTransform":
         """Cycles to next 90-degree clockwise rotation for pattern preview."""
-        rotations = list(PatternTransform)
-        current_idx = rotations.index(self)
-        return rotations[(current_idx + 1) % len(rotations)]
+        return _NEXT_ROTATION[self]
 
     def to_turns(self) -> int:
         """Converts rotation angle to number of numpy rot90 operations needed."""
-        return self.value // 90
+        return _TURNS[self]
+
+
+# Lookup tables built once so rotation queries are a single dict access
+_NEXT_ROTATION: Dict[PatternTransform, PatternTransform] = {
+    PatternTransform.NONE: PatternTransform.RIGHT,
+    PatternTransform.RIGHT: PatternTransform.FLIP,
+    PatternTransform.FLIP: PatternTransform.LEFT,
+    PatternTransform.LEFT: PatternTransform.NONE,
+}
+_TURNS: Dict[PatternTransform, int] = {
+    transform: transform.value // 90 for transform in PatternTransform
+}
+_SWAPS_AXES: Dict[PatternTransform, bool] = {
+    transform: transform.value % 180 == 90 for transform in PatternTransform
+}
 
 
 class PatternStorage(Protocol):
@@ -47,22 +68,102 @@ class PatternStorage(Protocol):
         pass
 
 
+def _encode_rle_body(cells: PatternGrid) -> List[str]:
+    """Encodes pattern cells as RLE run tokens, one row at a time.
+
+    Run boundaries are located with numpy so Python only iterates per run,
+    not per cell; sparse Life patterns have few runs per row.
+    """
+    tokens: List[str] = []
+    for row in cells:
+        ends = np.append(np.nonzero(row[1:] != row[:-1])[0], len(row) - 1)
+        lengths = np.diff(np.append(-1, ends))
+        tokens.extend(
+            f"{length if length > 1 else ''}{'o' if alive else 'b'}"
+            for length, alive in zip(lengths.tolist(), row[ends].tolist())
+        )
+        tokens.append("$")
+
+    # Replace last $ with !
+    tokens[-1] = "!"
+    return tokens
+
+
+_DEFAULT_STORAGE_DIR = Path("patterns")
+
+# Most parsed patterns each FilePatternStorage keeps in memory
+_LOAD_CACHE_SIZE = 128
+
+
+@functools.lru_cache(maxsize=32)
+def _list_pattern_names(storage_dir: Path, mtime_ns: int) -> Tuple[str, ...]:
+    """Lists RLE pattern names in a directory, memoized per modification time.
+
+    Adding, removing or renaming a file bumps the directory mtime, which
+    changes the cache key and forces a fresh scan.
+    """
+    # A plain suffix check on scandir entries skips glob's pattern matching,
+    # and is_file() is answered from the directory entry without a stat
+    with os.scandir(storage_dir) as entries:
+        return tuple(
+            entry.name[: -len(".rle")]
+            for entry in entries
+            if entry.name.endswith(".rle") and entry.is_file()
+        )
+
+
 @dataclass
 class FilePatternStorage:
     """RLE-based pattern storage in project directory."""
 
-    storage_dir: Path = field(default_factory=lambda: Path("patterns"))
+    storage_dir: Path = _DEFAULT_STORAGE_DIR
+    # Recently parsed patterns keyed by name in least-recently-used order,
+    # tagged with the file mtime they were read at. Patterns are frozen and
+    # their cells read-only, so callers can share cached instances.
+    _cache: OrderedDict[str, Tuple[int, Pattern]] = field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False
+    )
+    _cache_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
 
     def save_pattern(self, pattern: Pattern) -> None:
         """Serializes pattern to RLE format."""
         # Create storage directory if needed
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self._write_file(*self._encode_rle(pattern))
+
+    def save_patterns(self, patterns: Iterable[Pattern], max_workers: int = 4) -> None:
+        """Serializes many patterns, overlapping RLE encoding with file writes.
 
-        # Build RLE content
-        lines = []
+        Patterns sharing a name map to the same file, so only the last one
+        per name is saved, matching calling save_pattern on each in order.
 
-        # Add metadata
-        lines.append(f"#N {pattern.metadata.name}")
+        Args:
+            patterns: Patterns to save
+            max_workers: Threads used for each of the encode and write stages
+        """
+        # Writes complete in any order, so deduplicate up front to keep the
+        # file for each name deterministic
+        by_name = {pattern.metadata.name: pattern for pattern in patterns}
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        with (
+            ThreadPoolExecutor(max_workers) as encoders,
+            ThreadPoolExecutor(max_workers) as writers,
+        ):
+            encoded = [encoders.submit(self._encode_rle, p) for p in by_name.values()]
+            # Hand each file to the writers as soon as it is encoded so disk
+            # writes proceed while the remaining patterns are still encoding
+            written = [
+                writers.submit(self._write_file, *future.result())
+                for future in as_completed(encoded)
+            ]
+            for future in written:
+                future.result()
+
+    def _encode_rle(self, pattern: Pattern) -> Tuple[Path, List[str], List[str]]:
+        """Encodes pattern as RLE header lines and run tokens with its path."""
+        lines = [f"#N {pattern.metadata.name}"]
         if pattern.metadata.author:
             lines.append(f"#O {pattern.metadata.author}")
         if pattern.metadata.description:
@@ -72,725 +173,281 @@ class FilePatternStorage:
         # Add dimensions
         lines.append(f"x = {pattern.width}, y = {pattern.height}")
 
-        # Convert cells to RLE format
-        rle_data = []
-        for row in pattern.cells:
-            run_count = 1
-            current_cell = row[0]
-
-            for cell in row[1:]:
-                if cell == current_cell:
-                    run_count += 1
-                else:
-                    rle_data.append(str(run_count) if run_count > 1 else "")
-                    rle_data.append("o" if current_cell else "b")
-                    run_count = 1
-                    current_cell = cell
-
-            # Handle last run in row
-            rle_data.append(str(run_count) if run_count > 1 else "")
-            rle_data.append("o" if current_cell else "b")
-            rle_data.append("$")
-
-        # Replace last $ with !
-        rle_data[-1] = "!"
-        lines.append("".join(rle_data))
-
-        # Write to file
         file_path = self.storage_dir / f"{pattern.metadata.name}.rle"
-        file_path.write_text("\n".join(lines))
+        return file_path, lines, _encode_rle_body(pattern.cells)
+
+    def _write_file(self, file_path: Path, lines: List[str], tokens: List[str]) -> None:
+        """Writes encoded header lines and run tokens to disk."""
+        # Drop the cached copy explicitly; a rewrite within the filesystem's
+        # timestamp granularity would otherwise leave the mtime unchanged
+        with self._cache_lock:
+            self._cache.pop(file_path.stem, None)
+        # Stream header and body through one buffered handle instead of
+        # joining them into intermediate strings first
+        with file_path.open("w", buffering=64 * 1024) as f:
+            f.writelines(f"{line}\n" for line in lines)
+            f.writelines(tokens)
+        # Same hazard for the listing: a file created within the directory's
+        # timestamp granularity would not change its mtime
+        _list_pattern_names.cache_clear()
 
     def load_pattern(self, name: str) -> Optional[Pattern]:
-        """Loads pattern from RLE file."""
+        """Loads pattern from RLE file, reusing the last parse if unchanged."""
         file_path = self.storage_dir / f"{name}.rle"
-        if not file_path.exists():
+        try:
+            mtime_ns = file_path.stat().st_mtime_ns
+        except FileNotFoundError:
             return None
 
-        return parse_rle_pattern(file_path.read_text())
+        with self._cache_lock:
+            cached = self._cache.get(name)
+            if cached is not None and cached[0] == mtime_ns:
+                self._cache.move_to_end(name)
+                return cached[1]
+
+        try:
+            text = file_path.read_text()
+        except FileNotFoundError:
+            # Removed between the stat above and this read
+            return None
+        pattern = parse_rle_pattern(text)
+        # Every caller shares the cached instance, so guard it against edits
+        pattern.cells.setflags(write=False)
+        with self._cache_lock:
+            self._cache[name] = (mtime_ns, pattern)
+            self._cache.move_to_end(name)
+            if len(self._cache) > _LOAD_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return pattern
+
+    def load_all(self, max_workers: int = 4) -> Dict[str, Pattern]:
+        """Loads every stored pattern in one pass over the storage directory.
+
+        Files are read and parsed on a thread pool so their I/O overlaps;
+        unchanged files are served from the load cache.
+
+        Args:
+            max_workers: Threads used to read pattern files
+
+        Returns:
+            Patterns keyed by name; files removed mid-scan are skipped
+        """
+        names = self.list_patterns()
+        with ThreadPoolExecutor(max_workers) as readers:
+            loaded = readers.map(self.load_pattern, names)
+            return {
+                name: pattern
+                for name, pattern in zip(names, loaded)
+                if pattern is not None
+            }
 
     def list_patterns(self) -> List[str]:
         """Lists all RLE pattern files in storage directory."""
-        if not self.storage_dir.exists():
+        try:
+            mtime_ns = self.storage_dir.stat().st_mtime_ns
+        except FileNotFoundError:
             return []
-        return [f.stem for f in self.storage_dir.glob("*.rle")]
+        return list(_list_pattern_names(self.storage_dir, mtime_ns))
 
 
-# Built-in pattern library with historically significant patterns
-BUILTIN_PATTERNS = {
-    "glider": Pattern(
-        metadata=PatternMetadata(
+@functools.cache
+def default_storage() -> FilePatternStorage:
+    """Returns the shared storage for the default pattern directory.
+
+    Reusing one instance keeps its parse cache alive across lookups, which a
+    fresh FilePatternStorage() per call would throw away.
+    """
+    return FilePatternStorage()
+
+
+# Built-in pattern library with historically significant patterns, stored as
+# RLE bodies so the module carries no bulky cell literals. Cells are decoded
+# the first time a pattern is requested.
+_BUILTIN_SOURCES: Dict[str, Tuple[PatternMetadata, RLEDimensions, str]] = {
+    "glider": (
+        PatternMetadata(
             name="glider",
             description="Classic glider that moves diagonally",
             category=PatternCategory.SPACESHIP,
             discovery_year=1970,
-            tags=["spaceship", "common"],
-        ),
-        cells=cast(
-            PatternGrid,
-            np.array(
-                [[False, True, False], [False, False, True], [True, True, True]],
-                dtype=np.bool_,
-            ),
+            tags=("spaceship", "common"),
         ),
+        RLEDimensions(width=3, height=3),
+        "bo$2bo$3o!",
     ),
-    "blinker": Pattern(
-        metadata=PatternMetadata(
+    "blinker": (
+        PatternMetadata(
             name="blinker",
             description="Simple period 2 oscillator",
             category=PatternCategory.OSCILLATOR,
             oscillator_period=2,
-            tags=["oscillator", "common"],
+            tags=("oscillator", "common"),
         ),
-        cells=np.array([[True, True, True]], dtype=np.bool_),
+        RLEDimensions(width=3, height=1),
+        "3o!",
     ),
-    "block": Pattern(
-        metadata=PatternMetadata(
+    "block": (
+        PatternMetadata(
             name="block",
             description="Stable 2x2 block",
             category=PatternCategory.STILL_LIFE,
-            tags=["still life", "common"],
+            tags=("still life", "common"),
         ),
-        cells=np.array([[True, True], [True, True]], dtype=np.bool_),
+        RLEDimensions(width=2, height=2),
+        "2o$2o!",
     ),
-    "pulsar": Pattern(
-        metadata=PatternMetadata(
+    "pulsar": (
+        PatternMetadata(
             name="pulsar",
             description="Period 3 oscillator, one of the most common oscillators",
             category=PatternCategory.OSCILLATOR,
             oscillator_period=3,
             discovery_year=1970,
-            tags=["oscillator", "common"],
+            tags=("oscillator", "common"),
         ),
-        cells=np.array(
-            [
-                [
-                    False,
-                    False,
-                    True,
-                    True,
-                    True,
-                    False,
-                    False,
-                    False,
-                    True,
-                    True,
-                    True,
-                    False,
-                    False,
-                ],
-                [
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                ],
-                [
-                    True,
-                    False,
-                    False,
-                    False,
-                    False,
-                    True,
-                    False,
-                    True,
-                    False,
-                    False,
-                    False,
-                    False,
-                    True,
-                ],
-                [
-                    True,
-                    False,
-                    False,
-                    False,
-                    False,
-                    True,
-                    False,
-                    True,
-                    False,
-                    False,
-                    False,
-                    False,
-                    True,
-                ],
-                [
-                    True,
-                    False,
-                    False,
-                    False,
-                    False,
-                    True,
-                    False,
-                    True,
-                    False,
-                    False,
-                    False,
-                    False,
-                    True,
-                ],
-                [
-                    False,
-                    False,
-                    True,
-                    True,
-                    True,
-                    False,
-                    False,
-                    False,
-                    True,
-                    True,
-                    True,
-                    False,
-                    False,
-                ],
-                [
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                ],
-                [
-                    False,
-                    False,
-                    True,
-                    True,
-                    True,
-                    False,
-                    False,
-                    False,
-                    True,
-                    True,
-                    True,
-                    False,
-                    False,
-                ],
-                [
-                    True,
-                    False,
-                    False,
-                    False,
-                    False,
-                    True,
-                    False,
-                    True,
-                    False,
-                    False,
-                    False,
-                    False,
-                    True,
-                ],
-                [
-                    True,
-                    False,
-                    False,
-                    False,
-                    False,
-                    True,
-                    False,
-                    True,
-                    False,
-                    False,
-                    False,
-                    False,
-                    True,
-                ],
-                [
-                    True,
-                    False,
-                    False,
-                    False,
-                    False,
-                    True,
-                    False,
-                    True,
-                    False,
-                    False,
-                    False,
-                    False,
-                    True,
-                ],
-                [
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                ],
-                [
-                    False,
-                    False,
-                    True,
-                    True,
-                    True,
-                    False,
-                    False,
-                    False,
-                    True,
-                    True,
-                    True,
-                    False,
-                    False,
-                ],
-            ],
-            dtype=np.bool_,
+        RLEDimensions(width=13, height=13),
+        (
+            "2b3o3b3o2$o4bobo4bo$o4bobo4bo$o4bobo4bo$2b3o3b3o2$"
+            "2b3o3b3o$o4bobo4bo$o4bobo4bo$o4bobo4bo2$2b3o3b3o!"
         ),
     ),
-    "lwss": Pattern(
-        metadata=PatternMetadata(
+    "lwss": (
+        PatternMetadata(
             name="lwss",
             description="Lightweight spaceship that moves horizontally",
             category=PatternCategory.SPACESHIP,
             discovery_year=1970,
-            tags=["spaceship", "common"],
-        ),
-        cells=np.array(
-            [
-                [False, True, True, True, True],
-                [True, False, False, False, True],
-                [True, False, False, False, False],
-                [True, False, False, True, False],
-            ],
-            dtype=np.bool_,
+            tags=("spaceship", "common"),
         ),
+        RLEDimensions(width=5, height=4),
+        "b4o$o3bo$o$o2bo!",
     ),
-    "pentadecathlon": Pattern(
-        metadata=PatternMetadata(
+    "pentadecathlon": (
+        PatternMetadata(
             name="pentadecathlon",
             description="Period 15 oscillator",
             category=PatternCategory.OSCILLATOR,
             oscillator_period=15,
             discovery_year=1970,
-            tags=["oscillator", "common"],
-        ),
-        cells=np.array(
-            [
-                [False, False, True, False, False, False, False, True, False, False],
-                [True, True, False, True, True, True, True, False, True, True],
-                [False, False, True, False, False, False, False, True, False, False],
-            ],
-            dtype=np.bool_,
+            tags=("oscillator", "common"),
         ),
+        RLEDimensions(width=10, height=3),
+        "2bo4bo$2ob4ob2o$2bo4bo!",
     ),
-    "rpentomino": Pattern(
-        metadata=PatternMetadata(
+    "rpentomino": (
+        PatternMetadata(
             name="rpentomino",
             description="Methuselah that evolves for many generations",
             category=PatternCategory.METHUSELAH,
             discovery_year=1970,
-            tags=["methuselah", "common"],
-        ),
-        cells=np.array(
-            [
-                [False, True, True],
-                [True, True, False],
-                [False, True, False],
-            ],
-            dtype=np.bool_,
+            tags=("methuselah", "common"),
         ),
+        RLEDimensions(width=3, height=3),
+        "b2o$2o$bo!",
     ),
-    "gosperglider": Pattern(
-        metadata=PatternMetadata(
+    "gosperglider": (
+        PatternMetadata(
             name="gosperglider",
             description="First discovered gun pattern",
             category=PatternCategory.GUN,
             discovery_year=1970,
-            tags=["gun", "common"],
+            tags=("gun", "common"),
         ),
-        cells=np.array(
-            [
-                [
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    True,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                ],
-                [
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    True,
-                    False,
-                    True,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                ],
-                [
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    True,
-                    True,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    True,
-                    True,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    True,
-                    True,
-                ],
-                [
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    True,
-                    False,
-                    False,
-                    False,
-                    True,
-                    False,
-                    False,
-                    False,
-                    False,
-                    True,
-                    True,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    True,
-                    True,
-                ],
-                [
-                    True,
-                    True,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    True,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    True,
-                    False,
-                    False,
-                    False,
-                    True,
-                    True,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                ],
-                [
-                    True,
-                    True,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    True,
-                    False,
-                    False,
-                    False,
-                    True,
-                    False,
-                    True,
-                    True,
-                    False,
-                    False,
-                    False,
-                    False,
-                    True,
-                    False,
-                    True,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                ],
-                [
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    True,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    True,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    True,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                ],
-                [
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    True,
-                    False,
-                    False,
-                    False,
-                    True,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                ],
-                [
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    True,
-                    True,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                ],
-            ],
-            dtype=np.bool_,
+        RLEDimensions(width=36, height=9),
+        (
+            "24bo$22bobo$12b2o6b2o12b2o$11bo3bo4b2o12b2o$2o8bo5bo3b2o$"
+            "2o8bo3bob2o4bobo$10bo5bo7bo$11bo3bo$12b2o!"
         ),
     ),
-    "beehive": Pattern(
-        metadata=PatternMetadata(
+    "beehive": (
+        PatternMetadata(
             name="beehive",
             description="Common stable formation",
             category=PatternCategory.STILL_LIFE,
             discovery_year=1970,
-            tags=["still life", "common"],
-        ),
-        cells=np.array(
-            [
-                [False, True, True, False],
-                [True, False, False, True],
-                [False, True, True, False],
-            ],
-            dtype=np.bool_,
+            tags=("still life", "common"),
         ),
+        RLEDimensions(width=4, height=3),
+        "b2o$o2bo$b2o!",
     ),
 }
 
 
+@functools.cache
+def get_builtin(name: str) -> Pattern:
+    """Decodes a built-in pattern from its RLE source on first request.
+
+    Raises:
+        KeyError: If no built-in pattern has the given name
+    """
+    metadata, dimensions, data = _BUILTIN_SOURCES[name]
+    cells = parse_pattern_data(data, dimensions)
+    # Every caller shares the one cached instance, so guard it against edits
+    cells.setflags(write=False)
+    return Pattern.from_cells(metadata, cells)
+
+
+class _BuiltinPatternLibrary(Mapping[str, Pattern]):
+    """Read-only mapping over built-in patterns that decodes entries lazily."""
+
+    def __getitem__(self, name: str) -> Pattern:
+        return get_builtin(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_BUILTIN_SOURCES)
+
+    def __len__(self) -> int:
+        return len(_BUILTIN_SOURCES)
+
+
+BUILTIN_PATTERNS: Mapping[str, Pattern] = _BuiltinPatternLibrary()
+
+# Serializes parallel search kernel launches from concurrent callers
+_KERNEL_LOCK = threading.Lock()
+
+# Grid size from which pattern search switches to the parallel kernel
+_PARALLEL_SEARCH_MIN_CELLS = 10000
+
+# Pattern area above which large-grid search correlates via FFT instead of
+# comparing windows cell by cell
+_FFT_SEARCH_MIN_PATTERN_CELLS = 64
+
+# Widest pattern whose rows fit in one packed word on the small-grid path
+_PACKED_ROW_BITS = 64
+
+# Upper bound on window cells compared per block on the small-grid search path
+_SEARCH_BLOCK_CELLS = 1 << 20
+
+
+def get_pattern_cell_arrays(
+    pattern: Pattern, turns: int = 0
+) -> Tuple[IntArray, IntArray]:
+    """Returns (xs, ys) coordinate arrays for live cells after rotation.
+
+    Args:
+        pattern: Pattern to get cells from
+        turns: Number of 90-degree clockwise rotations to apply
+
+    Returns:
+        Parallel arrays of x and y coordinates for live cells after rotation
+    """
+    turns %= 4
+    cached = pattern._rot_cache.get(turns)
+    if cached is not None:
+        return cached
+
+    # rot90 only swaps strides, so rotating the bitmap is an O(1) view and the
+    # coordinates come out of nonzero already in the rotated frame
+    ys, xs = np.nonzero(np.rot90(pattern.cells, k=-turns))
+    # Cached arrays are shared between callers, so guard them against mutation
+    xs.setflags(write=False)
+    ys.setflags(write=False)
+    arrays = (cast(IntArray, xs), cast(IntArray, ys))
+    if pattern._cacheable:
+        pattern._rot_cache[turns] = arrays
+    return arrays
+
+
 def get_pattern_cells(pattern: Pattern, turns: int = 0) -> List[GridPosition]:
     """Returns list of (x,y) coordinates for live cells after rotation.
 
@@ -801,24 +458,8 @@ def get_pattern_cells(pattern: Pattern, turns: int = 0) -> List[GridPosition]:
     Returns:
         List of (x, y) coordinates for live cells after rotation
     """
-    cells: List[GridPosition] = []
-    height, width = pattern.cells.shape
-
-    for y in range(height):
-        for x in range(width):
-            if pattern.cells[y][x]:
-                # Transform coordinates based on rotation angle
-                match turns:
-                    case 0:  # Original orientation
-                        cells.append((x, y))
-                    case 1:  # 90° clockwise
-                        cells.append((height - 1 - y, x))
-                    case 2:  # 180°
-                        cells.append((width - 1 - x, height - 1 - y))
-                    case 3:  # 270° clockwise
-                        cells.append((y, width - 1 - x))
-
-    return cells
+    xs, ys = get_pattern_cell_arrays(pattern, turns)
+    return list(zip(xs.tolist(), ys.tolist()))
 
 
 def extract_pattern(
@@ -826,12 +467,28 @@ def extract_pattern(
     top_left: GridPosition,
     bottom_right: GridPosition,
     metadata: PatternMetadata,
+    copy: bool = True,
 ) -> Pattern:
-    """Creates a new pattern from a section of an existing grid."""
+    """Creates a new pattern from a section of an existing grid.
+
+    Args:
+        grid: Grid to extract from
+        top_left: Inclusive (x, y) corner of the section
+        bottom_right: Inclusive (x, y) corner of the section
+        metadata: Metadata for the new pattern
+        copy: Whether to copy the cells. Pass False for short-lived, read-only
+            uses to get a view of the grid instead; the pattern then changes
+            whenever the grid is modified, and its rotations and cell
+            coordinates are recomputed on every use rather than cached.
+
+    Returns:
+        Pattern holding the grid section
+    """
     x1, y1 = top_left
     x2, y2 = bottom_right
 
-    cells = cast(PatternGrid, grid[y1 : y2 + 1, x1 : x2 + 1].copy())
+    section = grid[y1 : y2 + 1, x1 : x2 + 1]
+    cells = cast(PatternGrid, section.copy() if copy else section)
     return Pattern(metadata=metadata, cells=cells)
 
 
@@ -842,12 +499,29 @@ def get_centered_position(
 ) -> GridPosition:
     """Calculates pattern placement position to center it on cursor."""
     x, y = cursor_position
-    # Adjust dimensions for rotated patterns
-    width = pattern.height if rotation.value in (90, 270) else pattern.width
-    height = pattern.width if rotation.value in (90, 270) else pattern.height
-    x_offset = width // 2
-    y_offset = height // 2
-    return (x - x_offset, y - y_offset)
+    height, width = pattern.cells.shape
+    # Quarter turns swap the pattern's width and height
+    if _SWAPS_AXES[rotation]:
+        width, height = height, width
+    return (x - width // 2, y - height // 2)
+
+
+def _wrapped_spans(start: int, length: int, size: int) -> List[Tuple[slice, slice]]:
+    """Splits a run that may wrap past the grid edge into (source, dest) slices.
+
+    Args:
+        start: Run start within the grid, in range [0, size)
+        length: Run length, at most size
+        size: Grid extent along this axis
+
+    Returns:
+        One slice pair, or two when the run crosses the edge
+    """
+    first = min(length, size - start)
+    spans = [(slice(0, first), slice(start, start + first))]
+    if first < length:
+        spans.append((slice(first, length), slice(0, length - first)))
+    return spans
 
 
 def place_pattern(
@@ -856,36 +530,207 @@ def place_pattern(
     position: GridPosition,
     rotation: PatternTransform = PatternTransform.NONE,
     centered: bool = True,
+    *,
+    out: Optional[Grid] = None,
 ) -> Grid:
-    """Places pattern on grid with boundary handling."""
-    new_grid = grid.copy()
-    turns = rotation.to_turns()
-    cells = get_pattern_cells(pattern, turns)
+    """Places pattern on grid with boundary handling.
+
+    Args:
+        grid: Grid to place the pattern on
+        pattern: Pattern to place
+        position: Target (x, y) position
+        rotation: Rotation to apply to the pattern
+        centered: Whether position is the pattern center rather than its corner
+        out: Optional buffer receiving the result. Passing ``grid`` itself
+            updates it in place and skips the copy; callers doing so give up
+            the immutability of their input.
+
+    Returns:
+        Grid with the pattern placed, which is ``out`` when provided
+    """
+    if out is None:
+        new_grid = np.empty_like(grid)
+        np.copyto(new_grid, grid)
+    else:
+        new_grid = out
+        if out is not grid:
+            np.copyto(new_grid, grid)
+
+    # Nothing to OR in for a pattern without live cells; the cached
+    # coordinates make this check free after the first placement
+    if not get_pattern_cell_arrays(pattern)[0].size:
+        return new_grid
 
     if centered:
         position = get_centered_position(pattern, position, rotation)
 
+    turns = rotation.to_turns()
     grid_height, grid_width = grid.shape
-    for dx, dy in cells:
-        # Convert from (x,y) to numpy's [y,x] indexing
-        x = (position[0] + dx) % grid_width
-        y = (position[1] + dy) % grid_height
-        # Swap x,y for numpy indexing
-        new_grid[y, x] = True
+    x, y = position[0] % grid_width, position[1] % grid_height
+    rotated = pattern.rotated(turns)
+    rotated_height, rotated_width = rotated.shape
+
+    # A pattern no larger than the grid wraps at most once per axis, so split
+    # it at the grid edges into up to four blocks and OR each one in as a
+    # contiguous slice; no per-cell modulo is needed
+    if rotated_width <= grid_width and rotated_height <= grid_height:
+        for src_y, dst_y in _wrapped_spans(y, rotated_height, grid_height):
+            for src_x, dst_x in _wrapped_spans(x, rotated_width, grid_width):
+                new_grid[dst_y, dst_x] |= rotated[src_y, src_x]
+        return new_grid
+
+    dxs, dys = get_pattern_cell_arrays(pattern, turns)
+    # Wrap and write every live cell in a single scatter; numpy indexes [y, x]
+    xs = (x + dxs) % grid_width
+    ys = (y + dys) % grid_height
+    new_grid[ys, xs] = True
 
     return new_grid
 
 
-def find_pattern(grid: Grid, pattern: Pattern) -> List[GridPosition]:
-    """Locates all instances of pattern in grid using sliding window comparison."""
-    positions: List[GridPosition] = []
+def _probe_order(grid: Grid, cells: PatternGrid) -> Tuple[IntArray, IntArray]:
+    """Orders template cells so those holding the grid's rarer state come first.
+
+    A window can only match where the grid agrees with the template, so
+    probing cells whose value is scarce in the grid (usually live cells on a
+    Life board) rejects almost every window on the first comparison.
+    """
+    live_is_rare = 2 * np.count_nonzero(grid) <= grid.size
+    flat = cells.ravel()
+    order = np.argsort(flat != live_is_rare, kind="stable")
+    probe_y, probe_x = np.divmod(order, cells.shape[1])
+    return probe_y.astype(np.int64), probe_x.astype(np.int64)
+
+
+def _pack_row_bits(cells: np.ndarray, width: int) -> np.ndarray:
+    """Packs every width-cell run along each row into one uint64 per start."""
+    starts = cells.shape[1] - width + 1
+    packed = np.zeros((cells.shape[0], starts), dtype=np.uint64)
+    for dx in range(width):
+        packed <<= np.uint64(1)
+        packed |= cells[:, dx : dx + starts]
+    return packed
+
+
+def _match_windows_packed(grid: Grid, cells: PatternGrid) -> np.ndarray:
+    """Flags exact template matches by comparing whole rows as 64-bit words.
+
+    Each window row collapses to a single integer, so a window costs one
+    comparison per pattern row instead of one per cell.
+    """
+    height = cells.shape[0]
+    grid_rows = _pack_row_bits(grid, cells.shape[1])
+    pattern_rows = _pack_row_bits(cells, cells.shape[1])[:, 0]
+    out_height = grid.shape[0] - height + 1
+
+    matches = grid_rows[:out_height] == pattern_rows[0]
+    for dy in range(1, height):
+        matches &= grid_rows[dy : dy + out_height] == pattern_rows[dy]
+    return cast(np.ndarray, matches)
+
+
+def _match_windows_fft(grid: Grid, cells: PatternGrid) -> np.ndarray:
+    """Flags exact template matches by cross-correlating +1/-1 encoded cells.
+
+    Each agreeing cell contributes +1 and each disagreeing cell -1, so a
+    window matches exactly when its score equals the template area. The
+    nearest non-match scores two less, which leaves ample margin for FFT
+    rounding error.
+    """
+    grid_signs = np.where(grid, 1.0, -1.0)
+    template_signs = np.where(cells, 1.0, -1.0)[::-1, ::-1]
+    scores = signal.fftconvolve(grid_signs, template_signs, mode="valid")
+    return cast(np.ndarray, scores > cells.size - 1)
+
+
+def find_pattern_array(grid: Grid, pattern: Pattern) -> PositionArray:
+    """Locates all instances of pattern in grid as an array of positions.
+
+    Large grids are searched by a parallel JIT-compiled kernel, or by FFT
+    cross-correlation when the pattern is big enough for that to win; small
+    grids compare bit-packed rows, or a sliding window view for very wide
+    patterns, where kernel dispatch would not pay off.
+
+    Returns:
+        (N, 2) int32 array of (x, y) top-left positions in row-major order
+    """
     pattern_height, pattern_width = pattern.cells.shape
+    if pattern_height > grid.shape[0] or pattern_width > grid.shape[1]:
+        return np.empty((0, 2), dtype=np.int32)
+
+    if (
+        grid.size >= _PARALLEL_SEARCH_MIN_CELLS
+        and pattern.cells.size > _FFT_SEARCH_MIN_PATTERN_CELLS
+    ):
+        matches = _match_windows_fft(grid, pattern.cells)
+    elif grid.size >= _PARALLEL_SEARCH_MIN_CELLS:
+        probe_y, probe_x = _probe_order(grid, pattern.cells)
+        # The kernel already spreads over every core, and numba's fallback
+        # threading layer rejects concurrent parallel launches
+        with _KERNEL_LOCK:
+            matches = match_pattern_windows(
+                np.ascontiguousarray(grid),
+                np.ascontiguousarray(pattern.cells),
+                probe_y,
+                probe_x,
+            )
+    elif pattern_width <= _PACKED_ROW_BITS:
+        matches = _match_windows_packed(grid, pattern.cells)
+    else:
+        windows = np.lib.stride_tricks.sliding_window_view(
+            grid, (pattern_height, pattern_width)
+        )
+        matches = np.empty(windows.shape[:2], dtype=np.bool_)
+        # Comparing a whole window view at once materializes one bool per
+        # window cell, so work in row blocks to keep that temporary bounded
+        block_rows = max(1, _SEARCH_BLOCK_CELLS // windows[0].size)
+        for y in range(0, matches.shape[0], block_rows):
+            block = windows[y : y + block_rows]
+            matches[y : y + block_rows] = (block == pattern.cells).all(axis=(2, 3))
+
+    # argwhere yields (y, x) rows; flip the columns to the (x, y) convention
+    return cast(PositionArray, np.argwhere(matches)[:, ::-1].astype(np.int32))
+
+
+def find_pattern(grid: Grid, pattern: Pattern) -> List[GridPosition]:
+    """Locates all instances of pattern in grid using sliding window comparison.
+
+    Callers that post-process positions with numpy should prefer
+    find_pattern_array and skip building the tuples.
+    """
+    return [(x, y) for x, y in find_pattern_array(grid, pattern).tolist()]
+
 
-    for y in range(grid.shape[0] - pattern_height + 1):
-        for x in range(grid.shape[1] - pattern_width + 1):
-            if np.array_equal(
-                grid[y : y + pattern_height, x : x + pattern_width], pattern.cells
-            ):
-                positions.append((x, y))
+def find_all_patterns(
+    grid: Grid, patterns: Iterable[Pattern], max_workers: Optional[int] = None
+) -> Dict[str, List[GridPosition]]:
+    """Locates every instance of each pattern in grid, searching concurrently.
 
-    return positions
+    The numpy and FFT search paths release the GIL for most of their work, so
+    patterns are searched on a thread pool.
+
+    Args:
+        grid: Grid to search
+        patterns: Patterns to look for, keyed in the result by name
+        max_workers: Thread count, defaulting to the executor's own choice
+
+    Returns:
+        Positions of each pattern, as find_pattern would return them
+
+    Raises:
+        ValueError: If two patterns share a name, since one result would
+            silently replace the other
+    """
+    patterns = list(patterns)
+    names = [pattern.metadata.name for pattern in patterns]
+    if len(set(names)) != len(names):
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        raise ValueError(f"Duplicate pattern names: {', '.join(duplicates)}")
+
+    grid = np.ascontiguousarray(grid)
+    with ThreadPoolExecutor(max_workers) as searchers:
+        found = {
+            name: searchers.submit(find_pattern, grid, pattern)
+            for name, pattern in zip(names, patterns)
+        }
+        return {name: future.result() for name, future in found.items()}
@@ -1,8 +1,11 @@
 """Terminal renderer for Game of Life."""
 
+import functools
+import os
 import sys
+import unicodedata
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Protocol, Tuple, runtime_checkable
+from typing import Any, Dict, List, Optional, Protocol, Tuple, Union, runtime_checkable
 
 import numpy as np
 from blessed import Terminal
@@ -13,10 +16,10 @@ from .grid import BoundaryCondition
 from .metrics import Metrics, update_frame_metrics, update_game_metrics
 from .patterns import (
     BUILTIN_PATTERNS,
-    FilePatternStorage,
     Pattern,
     PatternCategory,
     PatternTransform,
+    default_storage,
     get_centered_position,
     get_pattern_cells,
 )
@@ -267,7 +270,7 @@ def handle_pattern_mode_input(
                 patterns_by_category[category].append(name)
 
             # Add custom patterns
-            custom_patterns = FilePatternStorage().list_patterns()
+            custom_patterns = default_storage().list_patterns()
             if custom_patterns:
                 patterns_by_category[PatternCategory.CUSTOM] = custom_patterns
 
@@ -470,30 +473,31 @@ def calculate_viewport_bounds(
     return bounds, updated_terminal_pos
 
 
-def grid_to_dict(grid: Grid) -> RenderGrid:
-    """Convert grid to dictionary for efficient lookup using NumPy operations."""
-    rows, cols = grid.shape
-    return {(x, y): grid[y, x] for y in range(rows) for x in range(cols)}
-
-
-def render_status_line(
-    terminal: TerminalProtocol,
-    config: RendererConfig,
-    metrics: Metrics,
-) -> str:
-    """Renders status line with game metrics and performance indicators."""
-    plain_pop = f"Population: {metrics.game.active_cells}"
-    plain_gen = f"Generation: {metrics.game.generation_count}"
-    plain_births = f"Births/s: {metrics.game.birth_rate:.1f}"
-    plain_deaths = f"Deaths/s: {metrics.game.death_rate:.1f}"
-    plain_gen_rate = f"Gen/s: {1000/config.update_interval:.1f}"
+@functools.lru_cache(maxsize=16)
+def _format_status_body(
+    colors: Tuple[str, str, str, str, str, str],
+    population: int,
+    generation: int,
+    birth_rate: str,
+    death_rate: str,
+    gen_rate: str,
+    boundary: str,
+) -> Tuple[str, int]:
+    """Formats the status line body and its printable length.
+
+    Only depends on the displayed values, so frames between generations
+    reuse the same string instead of rebuilding it.
+    """
+    normal, blue, green, magenta, yellow, white = colors
+    plain_pop = f"Population: {population}"
+    plain_gen = f"Generation: {generation}"
+    plain_births = f"Births/s: {birth_rate}"
+    plain_deaths = f"Deaths/s: {death_rate}"
+    plain_gen_rate = f"Gen/s: {gen_rate}"
 
     # Add boundary condition
-    plain_boundary = f"Boundary: {config.boundary_condition.name}"
-    boundary_text = (
-        f" | {terminal.green}Boundary: {terminal.normal}"
-        f"{config.boundary_condition.name}"
-    )
+    plain_boundary = f"Boundary: {boundary}"
+    boundary_text = f" | {green}Boundary: {normal}{boundary}"
     plain_boundary_len = len(plain_boundary) + len(" | ")
 
     true_length = (
@@ -507,21 +511,38 @@ def render_status_line(
         + len(" ")
     )
 
-    pop = f"{terminal.blue}Population: {terminal.normal}{metrics.game.active_cells}"
-    gen = (
-        f"{terminal.green}Generation: {terminal.normal}{metrics.game.generation_count}"
-    )
-    births = (
-        f"{terminal.magenta}Births/s: {terminal.normal}{metrics.game.birth_rate:.1f}"
-    )
-    deaths = (
-        f"{terminal.yellow}Deaths/s: {terminal.normal}{metrics.game.death_rate:.1f}"
-    )
-    gen_rate = (
-        f"{terminal.white}Gen/s: {terminal.normal}{1000/config.update_interval:.1f}"
-    )
+    pop = f"{blue}Population: {normal}{population}"
+    gen = f"{green}Generation: {normal}{generation}"
+    births = f"{magenta}Births/s: {normal}{birth_rate}"
+    deaths = f"{yellow}Deaths/s: {normal}{death_rate}"
+    gen_rate_text = f"{white}Gen/s: {normal}{gen_rate}"
 
-    status = f"{pop} | {gen} | {births} | {deaths} | {gen_rate}{boundary_text}"
+    status = f"{pop} | {gen} | {births} | {deaths} | {gen_rate_text}{boundary_text}"
+    return status, true_length
+
+
+def render_status_line(
+    terminal: TerminalProtocol,
+    config: RendererConfig,
+    metrics: Metrics,
+) -> str:
+    """Renders status line with game metrics and performance indicators."""
+    status, true_length = _format_status_body(
+        (
+            terminal.normal,
+            terminal.blue,
+            terminal.green,
+            terminal.magenta,
+            terminal.yellow,
+            terminal.white,
+        ),
+        metrics.game.active_cells,
+        metrics.game.generation_count,
+        f"{metrics.game.birth_rate:.1f}",
+        f"{metrics.game.death_rate:.1f}",
+        f"{1000/config.update_interval:.1f}",
+        config.boundary_condition.name,
+    )
 
     y = terminal.height - 1
     x = max(0, (terminal.width - true_length) // 2)
@@ -547,7 +568,7 @@ def render_pattern_menu(
         patterns_by_category[category].append((name, pattern))
 
     # Add custom patterns
-    custom_patterns = FilePatternStorage().list_patterns()
+    custom_patterns = default_storage().list_patterns()
     if custom_patterns:
         patterns_by_category[PatternCategory.CUSTOM] = [
             (name, None) for name in custom_patterns
@@ -590,14 +611,15 @@ def render_pattern_menu(
 
 def calculate_render_metrics(
     grid: Grid,
-    previous_grid: Optional[RenderGrid],
+    previous_grid: Optional[Union[Grid, RenderGrid]],
     metrics: Metrics,
 ) -> Metrics:
     """Pure function to calculate updated metrics based on grid state.
 
     Args:
         grid: Current grid state
-        previous_grid: Previous grid state for calculating changes
+        previous_grid: Previous grid state for calculating changes, either as
+            an array shaped like grid or as a sparse render grid
         metrics: Current metrics state
 
     Returns:
@@ -613,9 +635,12 @@ def calculate_render_metrics(
     )
 
     if previous_grid is not None:
-        prev_grid = np.zeros_like(grid)
-        for (x, y), val in previous_grid.items():
-            prev_grid[y, x] = val
+        if isinstance(previous_grid, np.ndarray):
+            prev_grid = previous_grid
+        else:
+            prev_grid = np.zeros_like(grid)
+            for (x, y), val in previous_grid.items():
+                prev_grid[y, x] = val
 
         births = np.logical_and(~prev_grid, grid)
         deaths = np.logical_and(prev_grid, ~grid)
@@ -659,7 +684,7 @@ def calculate_pattern_cells(
     if not pattern_name:
         return set()
 
-    pattern = BUILTIN_PATTERNS.get(pattern_name) or FilePatternStorage().load_pattern(
+    pattern = BUILTIN_PATTERNS.get(pattern_name) or default_storage().load_pattern(
         pattern_name
     )
     if not pattern:
@@ -751,10 +776,16 @@ def apply_initialization(
     sys.stdout.flush()
 
 
+def is_live_cell(grid: Grid, x: int, y: int) -> bool:
+    """Checks whether (x, y) is a live cell, treating off-grid cells as dead."""
+    height, width = grid.shape
+    return 0 <= x < width and 0 <= y < height and bool(grid[y, x])
+
+
 def calculate_cell_display(
     x: int,
     y: int,
-    current_grid: RenderGrid,
+    grid: Grid,
     pattern_cells: set[GridPosition],  # Set of (x,y) coordinates for pattern preview
     cursor_pos: GridPosition,  # (x, y) coordinates of cursor in grid space
     pattern_mode: bool,
@@ -765,7 +796,7 @@ def calculate_cell_display(
 
     Args:
         x, y: Cell coordinates
-        current_grid: Current grid state
+        grid: Current grid state; coordinates outside it count as dead
         pattern_cells: Set of pattern preview cells
         cursor_pos: Current cursor position
         pattern_mode: Whether pattern mode is active
@@ -775,7 +806,7 @@ def calculate_cell_display(
     Returns:
         Tuple of (character, color) to display
     """
-    is_alive = current_grid.get((x, y), False)
+    is_alive = is_live_cell(grid, x, y)
     is_pattern = (x, y) in pattern_cells
     is_cursor = pattern_mode and x == cursor_pos[0] and y == cursor_pos[1]
 
@@ -788,34 +819,96 @@ def calculate_cell_display(
     return config.cell_dead, terminal.dim
 
 
-def render_cell(
-    terminal: TerminalProtocol,
-    screen_pos: ScreenPosition,  # Terminal coordinates (x, y)
-    cell_char: str,
-    color: str,
-    config: RendererConfig,
-    is_highlighted: bool,
-) -> None:
-    """Render a single cell to the terminal.
+@functools.cache
+def _ambiguous_is_wide() -> bool:
+    """Whether East Asian ambiguous-width characters render two columns wide.
+
+    Terminals in CJK locales conventionally draw them double-width, which
+    covers the default cell glyphs.
+    """
+    for var in ("LC_ALL", "LC_CTYPE", "LANG"):
+        value = os.environ.get(var)
+        if value:
+            return value.split("_")[0].lower() in ("ja", "ko", "zh")
+    return False
+
+
+def cell_display_width(text: str) -> int:
+    """Estimates how many terminal columns text occupies.
 
     Args:
-        terminal: Terminal interface
-        screen_pos: Screen coordinates (x, y)
-        cell_char: Character to display
-        color: Color to use
+        text: Plain text without escape sequences
+
+    Returns:
+        Column count, counting wide characters (and ambiguous ones in CJK
+        locales) as two and combining marks as zero
+    """
+    width = 0
+    for char in text:
+        if unicodedata.combining(char):
+            continue
+        east_asian = unicodedata.east_asian_width(char)
+        if east_asian in ("W", "F") or (east_asian == "A" and _ambiguous_is_wide()):
+            width += 2
+        else:
+            width += 1
+    return width
+
+
+def build_cell_strings(
+    terminal: TerminalProtocol, config: RendererConfig
+) -> Dict[Tuple[str, str], str]:
+    """Pre-formats the styled string for every cell display variant.
+
+    Args:
+        terminal: Terminal for color access
         config: Renderer configuration
-        is_highlighted: Whether cell should be highlighted
+
+    Returns:
+        Mapping of (character, color) from calculate_cell_display to the
+        full string written for that cell, including trailing spacing
     """
-    print(
-        terminal.move_xy(screen_pos[0], screen_pos[1])
-        + color
-        + cell_char
-        + (terminal.normal if is_highlighted else terminal.dim)
+    variants = (
+        ("+", terminal.yellow),
+        ("◆", terminal.blue),
+        (config.cell_alive, terminal.white),
+    )
+    cell_strings = {
+        (char, color): (
+            color + char + terminal.normal + config.cell_spacing + terminal.normal
+        )
+        for char, color in variants
+    }
+    # Dead cells keep their spacing dimmed; everything else is highlighted
+    cell_strings[(config.cell_dead, terminal.dim)] = (
+        terminal.dim
+        + config.cell_dead
+        + terminal.dim
         + config.cell_spacing
-        + terminal.normal,
-        end="",
-        flush=True,
+        + terminal.normal
     )
+    return cell_strings
+
+
+def format_cell_run(
+    terminal: TerminalProtocol,
+    screen_pos: ScreenPosition,  # Terminal coordinates (x, y) of the first cell
+    cell_strs: List[str],
+) -> str:
+    """Formats a horizontal run of adjacent cells behind a single cursor move.
+
+    Every cell in the run must occupy exactly two terminal columns, matching
+    the renderer's layout, or later cells would drift out of place.
+
+    Args:
+        terminal: Terminal interface
+        screen_pos: Screen coordinates (x, y) of the leftmost cell
+        cell_strs: Pre-formatted cell strings from build_cell_strings
+
+    Returns:
+        Output string for the whole run
+    """
+    return terminal.move_xy(screen_pos[0], screen_pos[1]) + "".join(cell_strs)
 
 
 def render_debug_status_line(
@@ -921,8 +1014,15 @@ def render_grid_to_terminal(
     # Pure calculations
     grid_height, grid_width = grid.shape
     usable_height = terminal.height - (3 if state.debug_mode else 2)
-    current_grid = grid_to_dict(grid)
-    metrics = calculate_render_metrics(grid, current_grid, metrics)
+    # Diff against the last rendered frame directly; after a resize or
+    # expansion the shapes differ and there is nothing to compare
+    previous_grid = state.previous_grid
+    if previous_grid is not None and previous_grid.shape != grid.shape:
+        previous_grid = None
+    metrics = calculate_render_metrics(grid, previous_grid, metrics)
+
+    # Output segments for this frame, written with a single flush at the end
+    frame: List[str] = []
 
     # Get current viewport bounds first
     viewport_bounds, updated_terminal_pos = calculate_viewport_bounds(
@@ -965,11 +1065,7 @@ def render_grid_to_terminal(
         for screen_x, screen_y in cells_to_clear:
             if screen_x >= terminal.width - 1 or screen_y >= usable_height:
                 continue
-            print(
-                terminal.move_xy(screen_x, screen_y) + "  ",
-                end="",
-                flush=True,
-            )
+            frame.append(terminal.move_xy(screen_x, screen_y) + "  ")
 
     pattern_cells = calculate_pattern_cells(
         viewport_bounds.visible_dims[0],  # Use viewport dimensions for pattern calc
@@ -984,8 +1080,22 @@ def render_grid_to_terminal(
         np.zeros_like(grid) if pattern_cells is None else np.array(list(pattern_cells))
     )
 
-    # Render cells
+    # Render cells, one cursor move per run of adjacent cells in a row. Runs
+    # rely on every cell filling exactly the two columns it is laid out in;
+    # cells drawn wider or narrower get their own cursor move instead.
+    cell_strings = build_cell_strings(terminal, config)
+    two_columns = {
+        display
+        for display in cell_strings
+        if cell_display_width(display[0] + config.cell_spacing) == 2
+    }
     for vy in range(viewport_bounds.visible_dims[1]):
+        screen_y = updated_terminal_pos.y + vy
+        if screen_y >= usable_height:
+            continue
+
+        run: List[str] = []
+        run_start = updated_terminal_pos.x
         for vx in range(viewport_bounds.visible_dims[0]):
             # Calculate grid coordinates based on boundary condition
             if config.boundary_condition in (
@@ -999,10 +1109,9 @@ def render_grid_to_terminal(
                 y = viewport_bounds.grid_start[1] + vy
 
             screen_x = updated_terminal_pos.x + (vx * 2)
-            screen_y = updated_terminal_pos.y + vy
 
-            if screen_x >= terminal.width - 1 or screen_y >= usable_height:
-                continue
+            if screen_x >= terminal.width - 1:
+                break
 
             # Check grid bounds for live cells in INFINITE mode
             if config.boundary_condition == BoundaryCondition.INFINITE:
@@ -1015,12 +1124,18 @@ def render_grid_to_terminal(
                     )
                     is_pattern = (x, y) in pattern_cells
                     if not (is_cursor or is_pattern):
+                        # Skipped cells end the current run
+                        if run:
+                            frame.append(
+                                format_cell_run(terminal, (run_start, screen_y), run)
+                            )
+                            run = []
                         continue
 
-            cell_char, color = calculate_cell_display(
+            display = calculate_cell_display(
                 x,
                 y,
-                current_grid,
+                grid,
                 pattern_cells,
                 (state.cursor_x, state.cursor_y),  # Use actual cursor position
                 state.pattern_mode,
@@ -1028,20 +1143,15 @@ def render_grid_to_terminal(
                 terminal,
             )
 
-            is_highlighted = (
-                current_grid.get((x, y), False)
-                or (x, y) in pattern_cells
-                or (state.pattern_mode and x == state.cursor_x and y == state.cursor_y)
-            )
+            if not run:
+                run_start = screen_x
+            run.append(cell_strings[display])
+            if display not in two_columns:
+                frame.append(format_cell_run(terminal, (run_start, screen_y), run))
+                run = []
 
-            render_cell(
-                terminal,
-                (screen_x, screen_y),
-                cell_char,
-                color,
-                config,
-                is_highlighted,
-            )
+        if run:
+            frame.append(format_cell_run(terminal, (run_start, screen_y), run))
 
     # Update state and metrics
     state = (
@@ -1054,22 +1164,18 @@ def render_grid_to_terminal(
 
     # Render status lines
     if state.pattern_mode:
-        print(render_pattern_menu(terminal, config), end="", flush=True)
+        frame.append(render_pattern_menu(terminal, config))
     else:
         # Always clear the debug line position
-        print(
-            terminal.move_xy(0, terminal.height - 2) + " " * terminal.width,
-            end="",
-            flush=True,
-        )
+        frame.append(terminal.move_xy(0, terminal.height - 2) + " " * terminal.width)
 
         if state.debug_mode:
-            print(
-                render_debug_status_line(terminal, grid, state, metrics),
-                end="",
-                flush=True,
-            )
-        print(render_status_line(terminal, config, metrics), end="", flush=True)
+            frame.append(render_debug_status_line(terminal, grid, state, metrics))
+        frame.append(render_status_line(terminal, config, metrics))
+
+    # Write the whole frame at once so the terminal never sees a partial one
+    sys.stdout.write("".join(frame))
+    sys.stdout.flush()
 
     return state, metrics
 
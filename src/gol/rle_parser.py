@@ -107,13 +107,15 @@ def parse_pattern_data(data: str, dimensions: RLEDimensions) -> PatternGrid:
             if char == "b":  # Dead cells
                 x += count
             elif char == "o":  # Live cells
-                for i in range(count):
-                    if x >= dimensions.width:
-                        raise RLEParseError("Pattern data exceeds specified width")
-                    if y >= dimensions.height:
-                        raise RLEParseError("Pattern data exceeds specified height")
-                    pattern[y, x] = True
-                    x += 1
+                if x >= dimensions.width:
+                    raise RLEParseError("Pattern data exceeds specified width")
+                if y >= dimensions.height:
+                    raise RLEParseError("Pattern data exceeds specified height")
+                if x + count > dimensions.width:
+                    raise RLEParseError("Pattern data exceeds specified width")
+                # Fill the whole run with one slice write rather than per cell
+                pattern[y, x : x + count] = True
+                x += count
             elif char == "$":  # End of row
                 if x > dimensions.width:
                     raise RLEParseError("Pattern data exceeds specified width")
@@ -182,12 +184,12 @@ def parse_rle_pattern(content: str) -> Pattern:
     except RLEParseError as e:
         raise RLEParseError(f"Invalid pattern data: {e}")
 
-    return Pattern(
-        metadata=PatternMetadata(
+    return Pattern.from_cells(
+        PatternMetadata(
             name=name,
             description=description,
             category=PatternCategory.CUSTOM,
             author=author,
         ),
-        cells=cells,
+        cells,
     )
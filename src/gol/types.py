@@ -12,6 +12,7 @@ from numpy.typing import NDArray
 
 # Core grid types
 GridPosition: TypeAlias = tuple[int, int]  # (x, y) coordinates
+PositionArray: TypeAlias = NDArray[np.int32]  # (N, 2) array of (x, y) rows
 Grid: TypeAlias = NDArray[np.bool_]  # Main game grid
 GridView: TypeAlias = NDArray[np.bool_]  # View into a grid section
 GridIndex: TypeAlias = Union[int, slice]  # Grid indexing types
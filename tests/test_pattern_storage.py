@@ -1,9 +1,12 @@
 """Tests for RLE pattern storage functionality."""
 
+import os
 from pathlib import Path
 
 import numpy as np
+import pytest
 
+from gol import patterns
 from gol.patterns import FilePatternStorage, Pattern, PatternCategory, PatternMetadata
 
 
@@ -154,3 +157,211 @@ def test_pattern_storage_with_empty_directory(tmp_path: Path) -> None:
 
     assert storage.list_patterns() == []
     assert storage.load_pattern("any") is None
+
+
+def test_list_patterns_sees_new_files(tmp_path: Path) -> None:
+    """Test pattern listing stays current after the directory changes.
+
+    Given: A storage directory that has already been listed
+    When: Saving another pattern into it
+    Then: The next listing should include the new pattern, even when the
+        directory mtime does not move (coarse filesystem timestamps)
+    """
+    storage = FilePatternStorage(storage_dir=tmp_path)
+    (tmp_path / "glider.rle").write_text("#N glider\nx = 3, y = 3\nbo$2bo$3o!")
+    assert storage.list_patterns() == ["glider"]
+    listed_stat = tmp_path.stat()
+
+    storage.save_pattern(
+        Pattern(
+            metadata=PatternMetadata(
+                name="dot", description="", category=PatternCategory.CUSTOM
+            ),
+            cells=np.array([[True]], dtype=np.bool_),
+        )
+    )
+    # Simulate the save landing in the same timestamp tick as the listing
+    os.utime(tmp_path, ns=(listed_stat.st_atime_ns, listed_stat.st_mtime_ns))
+
+    assert sorted(FilePatternStorage(storage_dir=tmp_path).list_patterns()) == [
+        "dot",
+        "glider",
+    ]
+
+
+def test_save_patterns_batch(tmp_path: Path) -> None:
+    """Test saving several patterns in one call.
+
+    Given: A batch of distinct patterns
+    When: Saving them together
+    Then: Each should round-trip through its own RLE file
+    """
+    storage = FilePatternStorage(storage_dir=tmp_path / "batch")
+    rng = np.random.default_rng(7)
+    patterns = [
+        Pattern(
+            metadata=PatternMetadata(
+                name=f"p{i}", description="", category=PatternCategory.CUSTOM
+            ),
+            cells=rng.random((5, 4 + i)) < 0.5,
+        )
+        for i in range(6)
+    ]
+
+    storage.save_patterns(patterns, max_workers=2)
+
+    assert sorted(storage.list_patterns()) == [f"p{i}" for i in range(6)]
+    for pattern in patterns:
+        loaded = storage.load_pattern(pattern.metadata.name)
+        assert loaded is not None
+        np.testing.assert_array_equal(loaded.cells, pattern.cells)
+
+
+def test_save_patterns_duplicate_names_keep_last(tmp_path: Path) -> None:
+    """Test saving a batch where several patterns share a name.
+
+    Given: Patterns that share a name, mixed with a distinct one
+    When: Saving them together
+    Then: The last pattern per name should be the one on disk
+    """
+    storage = FilePatternStorage(storage_dir=tmp_path)
+    rng = np.random.default_rng(11)
+
+    def make(name: str) -> Pattern:
+        return Pattern(
+            metadata=PatternMetadata(
+                name=name, description="", category=PatternCategory.CUSTOM
+            ),
+            cells=rng.random((6, 6)) < 0.5,
+        )
+
+    patterns = [make("dup") for _ in range(8)] + [make("other")]
+
+    storage.save_patterns(patterns, max_workers=4)
+
+    loaded = storage.load_pattern("dup")
+    assert loaded is not None
+    np.testing.assert_array_equal(loaded.cells, patterns[7].cells)
+    assert sorted(storage.list_patterns()) == ["dup", "other"]
+
+
+def test_load_all(tmp_path: Path) -> None:
+    """Test loading every stored pattern at once.
+
+    Given: A storage directory with several patterns
+    When: Loading all patterns
+    Then: Each should be returned by name and shared with load_pattern
+    """
+    storage = FilePatternStorage(storage_dir=tmp_path)
+    for name in ("a", "b"):
+        storage.save_pattern(
+            Pattern(
+                metadata=PatternMetadata(
+                    name=name, description="", category=PatternCategory.CUSTOM
+                ),
+                cells=np.array([[True, False]], dtype=np.bool_),
+            )
+        )
+
+    patterns = storage.load_all()
+
+    assert sorted(patterns) == ["a", "b"]
+    assert patterns["a"].cells.shape == (1, 2)
+    assert storage.load_pattern("b") is patterns["b"]
+
+
+def test_load_all_skips_file_removed_before_read(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test loading all patterns while one file vanishes mid-load.
+
+    Given: Two stored patterns, one of which disappears after being stat'ed
+    When: Loading all patterns
+    Then: The remaining pattern should load and the removed one be skipped
+    """
+    storage = FilePatternStorage(storage_dir=tmp_path)
+    for name in ("a", "b"):
+        (tmp_path / f"{name}.rle").write_text(f"#N {name}\nx = 1, y = 1\no!")
+    read_text = Path.read_text
+
+    def racing_read_text(self: Path, *args: object, **kwargs: object) -> str:
+        if self.name == "b.rle":
+            raise FileNotFoundError(self)
+        return read_text(self)
+
+    monkeypatch.setattr(Path, "read_text", racing_read_text)
+
+    loaded = storage.load_all()
+
+    assert sorted(loaded) == ["a"]
+
+
+def test_load_pattern_reuses_cached_parse(tmp_path: Path) -> None:
+    """Test repeated loads of an unchanged file share one parsed pattern.
+
+    Given: A saved pattern that has been loaded once
+    When: Loading it again, then overwriting it and loading once more
+    Then: The second load should be cached, read-only, and the third should
+        see the update
+    """
+    storage = FilePatternStorage(storage_dir=tmp_path)
+    metadata = PatternMetadata(
+        name="dot", description="", category=PatternCategory.CUSTOM
+    )
+    storage.save_pattern(
+        Pattern(metadata=metadata, cells=np.array([[True]], dtype=np.bool_))
+    )
+
+    first = storage.load_pattern("dot")
+    assert storage.load_pattern("dot") is first
+    assert first is not None
+    with pytest.raises(ValueError):
+        first.cells[0, 0] = False
+
+    storage.save_pattern(
+        Pattern(metadata=metadata, cells=np.array([[True, True]], dtype=np.bool_))
+    )
+    updated = storage.load_pattern("dot")
+
+    assert updated is not None
+    assert updated.cells.shape == (1, 2)
+
+
+def test_load_cache_evicts_least_recently_used(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the load cache stays bounded.
+
+    Given: A load cache limited to two patterns
+    When: Loading three patterns after touching the first again
+    Then: Only the least recently used pattern should be evicted, and a
+        reparsed pattern should be shared read-only like the rest
+    """
+    monkeypatch.setattr(patterns, "_LOAD_CACHE_SIZE", 2)
+    storage = FilePatternStorage(storage_dir=tmp_path)
+    for name in ("a", "b", "c"):
+        (tmp_path / f"{name}.rle").write_text(f"#N {name}\nx = 1, y = 1\no!")
+
+    first = storage.load_pattern("a")
+    storage.load_pattern("b")
+    assert storage.load_pattern("a") is first
+    storage.load_pattern("c")
+
+    assert storage.load_pattern("a") is first
+    assert list(storage._cache) == ["c", "a"]
+    reloaded = storage.load_pattern("b")
+    assert reloaded is not None
+    assert not reloaded.cells.flags.writeable
+
+
+def test_default_storage_is_shared() -> None:
+    """Test the default storage instance is reused between lookups.
+
+    Given: The default pattern storage accessor
+    When: Requesting it twice
+    Then: The same instance, pointed at the default directory, is returned
+    """
+    storage = patterns.default_storage()
+
+    assert patterns.default_storage() is storage
+    assert storage.storage_dir == Path("patterns")
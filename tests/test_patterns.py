@@ -8,11 +8,17 @@ import numpy as np
 import pytest
 
 from gol.patterns import (
+    BUILTIN_PATTERNS,
     Pattern,
     PatternCategory,
     PatternMetadata,
+    PatternTransform,
     extract_pattern,
+    find_all_patterns,
     find_pattern,
+    find_pattern_array,
+    get_pattern_cell_arrays,
+    get_pattern_cells,
     place_pattern,
 )
 from gol.types import Grid, GridPosition
@@ -158,3 +164,369 @@ def test_pattern_extraction(pattern_data: dict[str, Any], test_grid: Grid) -> No
 
     assert np.array_equal(extracted.cells, pattern.cells)
     assert extracted.metadata.name == pattern.metadata.name
+
+
+def test_pattern_from_cells() -> None:
+    """Test building a pattern from plain nested lists.
+
+    Given: Cell data as nested lists of truthy values
+    When: Creating a pattern with from_cells
+    Then: Cells should be a contiguous boolean array, and 1-D data rejected
+    """
+    metadata = PatternMetadata(
+        name="lists", description="lists", category=PatternCategory.CUSTOM
+    )
+
+    pattern = Pattern.from_cells(metadata, [[0, 1], [1, 0]])
+
+    assert pattern.cells.dtype == np.bool_
+    assert pattern.cells.flags.c_contiguous
+    assert np.array_equal(pattern.cells, [[False, True], [True, False]])
+    with pytest.raises(ValueError):
+        Pattern.from_cells(metadata, [True, False])
+
+
+def test_builtin_patterns_decode_from_rle() -> None:
+    """Test built-in patterns are decoded from their RLE sources.
+
+    Given: The built-in pattern library
+    When: Looking up patterns by name
+    Then: Cells should match the pattern definition and be decoded once
+    """
+    glider = BUILTIN_PATTERNS["glider"]
+    expected = np.array(
+        [[False, True, False], [False, False, True], [True, True, True]],
+        dtype=np.bool_,
+    )
+
+    assert np.array_equal(glider.cells, expected)
+    assert BUILTIN_PATTERNS["glider"] is glider
+    assert BUILTIN_PATTERNS["gosperglider"].cells.shape == (9, 36)
+    assert int(BUILTIN_PATTERNS["pulsar"].cells.sum()) == 48
+    assert "nonexistent" not in BUILTIN_PATTERNS
+    assert not glider.cells.flags.writeable
+
+
+@pytest.mark.parametrize("rotation", list(PatternTransform))
+def test_pattern_placement_wraps_at_edges(
+    rotation: PatternTransform, test_grid: Grid
+) -> None:
+    """Test pattern placement across grid edges.
+
+    Given: A pattern positioned so it overlaps the bottom-right corner
+    When: Placing the pattern without centering
+    Then: Cells beyond the edges should wrap to the opposite side
+    """
+    pattern = BUILTIN_PATTERNS["glider"]
+    pos: GridPosition = (4, 3)
+
+    result = place_pattern(test_grid, pattern, pos, rotation, centered=False)
+
+    rotated = np.rot90(pattern.cells, k=-rotation.to_turns())
+    expected = np.zeros_like(test_grid)
+    for dy, dx in zip(*np.nonzero(rotated)):
+        expected[(pos[1] + dy) % 5, (pos[0] + dx) % 5] = True
+    assert np.array_equal(result, expected)
+    assert not test_grid.any()
+
+
+def test_pattern_placement_into_output_buffer(
+    simple_pattern: Pattern, test_grid: Grid
+) -> None:
+    """Test pattern placement into a caller-provided buffer.
+
+    Given: A grid and a pattern
+    When: Placing the pattern into a scratch buffer or the grid itself
+    Then: The buffer should hold the result and be returned as-is
+    """
+    expected = place_pattern(test_grid, simple_pattern, (1, 1), centered=False)
+
+    scratch = np.ones_like(test_grid)
+    result = place_pattern(
+        test_grid, simple_pattern, (1, 1), centered=False, out=scratch
+    )
+    assert result is scratch
+    assert np.array_equal(scratch, expected)
+    assert not test_grid.any()
+
+    result = place_pattern(
+        test_grid, simple_pattern, (1, 1), centered=False, out=test_grid
+    )
+    assert result is test_grid
+    assert np.array_equal(test_grid, expected)
+
+
+def test_rotated_cells_are_cached(simple_pattern: Pattern) -> None:
+    """Test rotated cell coordinates are memoized per pattern.
+
+    Given: A pattern
+    When: Requesting the same rotation twice
+    Then: The cached read-only arrays should be returned
+    """
+    first = get_pattern_cell_arrays(simple_pattern, 1)
+    second = get_pattern_cell_arrays(simple_pattern, 1)
+
+    assert first[0] is second[0] and first[1] is second[1]
+    assert not first[0].flags.writeable
+    assert get_pattern_cells(simple_pattern, 1) == [(1, 0), (0, 1)]
+
+
+def test_pattern_rotated_is_cached(simple_pattern: Pattern) -> None:
+    """Test rotated cell grids are memoized per pattern.
+
+    Given: A pattern
+    When: Requesting rotated cells repeatedly
+    Then: Each rotation should be computed once, contiguous and read-only
+    """
+    rotated = simple_pattern.rotated(1)
+
+    assert simple_pattern.rotated(5) is rotated
+    assert rotated.flags.c_contiguous and not rotated.flags.writeable
+    assert np.array_equal(rotated, np.rot90(simple_pattern.cells, k=-1))
+    assert simple_pattern.cells.flags.writeable
+
+
+def test_rotation_cycles_clockwise() -> None:
+    """Test rotation cycling and turn counts.
+
+    Given: Each pattern rotation
+    When: Advancing to the next rotation
+    Then: Rotations should cycle clockwise with matching turn counts
+    """
+    rotation = PatternTransform.NONE
+    seen = []
+    for _ in range(4):
+        seen.append((rotation, rotation.to_turns()))
+        rotation = rotation.next_rotation()
+
+    assert rotation is PatternTransform.NONE
+    assert seen == [
+        (PatternTransform.NONE, 0),
+        (PatternTransform.RIGHT, 1),
+        (PatternTransform.FLIP, 2),
+        (PatternTransform.LEFT, 3),
+    ]
+
+
+def test_find_pattern_in_large_grid() -> None:
+    """Test pattern search on a grid large enough for the parallel kernel.
+
+    Given: A large empty grid with several gliders placed at known positions
+    When: Searching for the glider
+    Then: Every placed instance should be found in row-major order
+    """
+    pattern = BUILTIN_PATTERNS["glider"]
+    grid = np.zeros((120, 150), dtype=np.bool_)
+    positions: list[GridPosition] = [(3, 2), (140, 10), (70, 60), (0, 117)]
+    for pos in positions:
+        grid = place_pattern(grid, pattern, pos, centered=False)
+
+    found = find_pattern(grid, pattern)
+
+    assert found == sorted(positions, key=lambda p: (p[1], p[0]))
+
+
+def test_find_large_pattern_in_large_grid() -> None:
+    """Test searching a large grid for a pattern big enough for FFT matching.
+
+    Given: A large grid with pulsars and a near-miss copy
+    When: Searching for the pulsar
+    Then: Only the exact instances should be found
+    """
+    pattern = BUILTIN_PATTERNS["pulsar"]
+    grid = np.zeros((120, 150), dtype=np.bool_)
+    positions: list[GridPosition] = [(3, 2), (130, 40), (0, 100)]
+    for pos in positions:
+        grid = place_pattern(grid, pattern, pos, centered=False)
+    grid = place_pattern(grid, pattern, (60, 60), centered=False)
+    grid[65, 62] = not grid[65, 62]
+
+    found = find_pattern(grid, pattern)
+
+    assert found == sorted(positions, key=lambda p: (p[1], p[0]))
+
+
+@pytest.mark.parametrize("width", [64, 70])
+def test_find_wide_pattern_in_small_grid(width: int) -> None:
+    """Test searching a small grid for patterns around the packed-row limit.
+
+    Given: A small grid holding two copies of a wide row pattern
+    When: Searching for the pattern
+    Then: Both copies should be found whether or not rows fit in one word
+    """
+    cells = np.zeros((2, width), dtype=np.bool_)
+    cells[0, ::3] = True
+    cells[1, -1] = True
+    pattern = Pattern(
+        metadata=PatternMetadata(
+            name="wide", description="wide", category=PatternCategory.CUSTOM
+        ),
+        cells=cells,
+    )
+    grid = np.zeros((8, 80), dtype=np.bool_)
+    grid[1:3, 2 : 2 + width] = cells
+    grid[5:7, 9 : 9 + width] = cells
+
+    assert find_pattern(grid, pattern) == [(2, 1), (9, 5)]
+
+
+@pytest.mark.parametrize("rotation", list(PatternTransform))
+def test_large_pattern_placement_wraps(rotation: PatternTransform) -> None:
+    """Test placing a pattern larger than the grid it wraps around.
+
+    Given: The gosper glider gun and a grid narrower than the gun
+    When: Placing it across the grid edges
+    Then: Every live cell should land at its wrapped position
+    """
+    pattern = BUILTIN_PATTERNS["gosperglider"]
+    grid = np.zeros((20, 30), dtype=np.bool_)
+    rotated = np.rot90(pattern.cells, k=-rotation.to_turns())
+    ys, xs = np.nonzero(rotated)
+    expected = grid.copy()
+    expected[(ys - 5) % 20, (xs + 25) % 30] = True
+
+    result = place_pattern(grid, pattern, (25, -5), rotation, centered=False)
+
+    assert np.array_equal(result, expected)
+    assert not grid.any()
+
+
+def test_place_empty_pattern(test_grid: Grid) -> None:
+    """Test placing a pattern that has no live cells.
+
+    Given: A grid with live cells and an all-dead pattern
+    When: Placing the pattern
+    Then: A copy of the grid should be returned unchanged
+    """
+    test_grid[0, 0] = True
+    pattern = Pattern(
+        metadata=PatternMetadata(
+            name="empty", description="empty", category=PatternCategory.CUSTOM
+        ),
+        cells=np.zeros((3, 3), dtype=np.bool_),
+    )
+
+    result = place_pattern(test_grid, pattern, (2, 2))
+
+    assert result is not test_grid
+    assert np.array_equal(result, test_grid)
+
+
+def test_pattern_larger_than_grid_wraps_repeatedly(test_grid: Grid) -> None:
+    """Test placing a pattern wider than the grid.
+
+    Given: A 5x5 grid and a 1x7 row pattern
+    When: Placing the pattern from a negative position
+    Then: The row should wrap around and fill every column
+    """
+    pattern = Pattern(
+        metadata=PatternMetadata(
+            name="row", description="row", category=PatternCategory.CUSTOM
+        ),
+        cells=np.ones((1, 7), dtype=np.bool_),
+    )
+
+    result = place_pattern(test_grid, pattern, (-3, 2), centered=False)
+
+    assert result[2].all()
+    assert int(result.sum()) == 5
+
+
+def test_find_pattern_array(simple_pattern: Pattern, test_grid: Grid) -> None:
+    """Test pattern search returning positions as an array.
+
+    Given: A grid with the pattern placed at two positions
+    When: Searching for the pattern as an array
+    Then: Should return an (N, 2) int32 array of (x, y) rows
+    """
+    grid = place_pattern(test_grid, simple_pattern, (3, 0), centered=False)
+    grid = place_pattern(grid, simple_pattern, (0, 2), centered=False)
+
+    positions = find_pattern_array(grid, simple_pattern)
+
+    assert positions.dtype == np.int32
+    assert positions.tolist() == [[3, 0], [0, 2]]
+    assert find_pattern(grid, simple_pattern) == [(3, 0), (0, 2)]
+
+
+def test_pattern_extraction_as_view(test_grid: Grid) -> None:
+    """Test extracting a pattern without copying the grid section.
+
+    Given: A grid
+    When: Extracting a section with copy disabled
+    Then: The pattern cells should be a view that tracks the grid
+    """
+    metadata = PatternMetadata(
+        name="view", description="view", category=PatternCategory.CUSTOM
+    )
+
+    view = extract_pattern(test_grid, (1, 1), (2, 3), metadata, copy=False)
+    copied = extract_pattern(test_grid, (1, 1), (2, 3), metadata)
+    test_grid[2, 1] = True
+
+    assert view.cells.shape == (3, 2)
+    assert np.shares_memory(view.cells, test_grid)
+    assert view.cells[1, 0]
+    assert not copied.cells.any()
+
+
+def test_view_pattern_placement_tracks_grid_changes() -> None:
+    """Test placing a view-backed pattern after its source grid changes.
+
+    Given: A pattern extracted as a view, already placed once rotated
+    When: The source grid gains cells and the pattern is placed again
+    Then: The new placement and cell list should include the added cells
+    """
+    source = np.zeros((4, 4), dtype=np.bool_)
+    metadata = PatternMetadata(
+        name="view", description="view", category=PatternCategory.CUSTOM
+    )
+    view = extract_pattern(source, (0, 0), (1, 1), metadata, copy=False)
+    target = np.zeros((6, 6), dtype=np.bool_)
+
+    first = place_pattern(target, view, (2, 2), PatternTransform.RIGHT, centered=False)
+    source[0, 0] = True
+    second = place_pattern(target, view, (2, 2), PatternTransform.RIGHT, centered=False)
+    source[1, 0] = True
+    third = place_pattern(target, view, (2, 2), PatternTransform.RIGHT, centered=False)
+
+    assert not first.any()
+    assert second.sum() == 1
+    assert third.sum() == 2
+    assert sorted(get_pattern_cells(view, 1)) == [(0, 0), (1, 0)]
+
+
+def test_find_all_patterns() -> None:
+    """Test searching for several patterns in one call.
+
+    Given: A large grid holding a glider and a block
+    When: Searching for the glider, block and beehive together
+    Then: Each pattern's positions should be reported under its name
+    """
+    grid = np.zeros((120, 120), dtype=np.bool_)
+    grid = place_pattern(grid, BUILTIN_PATTERNS["glider"], (10, 20), centered=False)
+    grid = place_pattern(grid, BUILTIN_PATTERNS["block"], (60, 5), centered=False)
+    names = ["glider", "block", "beehive"]
+
+    found = find_all_patterns(grid, [BUILTIN_PATTERNS[name] for name in names])
+
+    assert found == {"glider": [(10, 20)], "block": [(60, 5)], "beehive": []}
+
+
+def test_find_all_patterns_rejects_duplicate_names() -> None:
+    """Test searching for patterns that share a name.
+
+    Given: A builtin glider and a custom pattern also named glider
+    When: Searching for both together
+    Then: A ValueError should name the duplicate instead of dropping a result
+    """
+    grid = np.zeros((20, 20), dtype=np.bool_)
+    custom = Pattern(
+        metadata=PatternMetadata(
+            name="glider", description="", category=PatternCategory.CUSTOM
+        ),
+        cells=np.ones((2, 2), dtype=np.bool_),
+    )
+
+    with pytest.raises(ValueError, match="glider"):
+        find_all_patterns(grid, [BUILTIN_PATTERNS["glider"], custom])
@@ -5,7 +5,7 @@ Focus on impure functions that handle terminal I/O and state management.
 
 import dataclasses
 import re
-from typing import Any, List
+from typing import Any, Callable, Iterator, List
 from unittest.mock import Mock, PropertyMock, patch
 
 import pytest
@@ -18,6 +18,7 @@ from gol.patterns import FilePatternStorage, PatternCategory, PatternTransform
 from gol.renderer import (
     RendererConfig,
     TerminalProtocol,
+    _ambiguous_is_wide,
     calculate_frame_interval,
     cleanup_terminal,
     handle_resize_event,
@@ -387,6 +388,113 @@ def test_debug_status_bar_clearing(mock_terminal: MockTerminal) -> None:
     ), "No debug info should be printed when debug mode is off"
 
 
+@pytest.fixture
+def locale_lang(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[Callable[[str], None]]:
+    """Sets the terminal locale for a test, resetting the cached width rule."""
+
+    def set_lang(lang: str) -> None:
+        for var in ("LC_ALL", "LC_CTYPE"):
+            monkeypatch.delenv(var, raising=False)
+        monkeypatch.setenv("LANG", lang)
+        _ambiguous_is_wide.cache_clear()
+
+    yield set_lang
+    _ambiguous_is_wide.cache_clear()
+
+
+def test_grid_rows_render_with_single_cursor_move(
+    mock_terminal: MockTerminal, locale_lang: Callable[[str], None]
+) -> None:
+    """Given a finite grid that fits in the terminal
+    When rendering a frame
+    Then each visible grid row is written with one cursor move
+    """
+    import numpy as np
+
+    # Given
+    locale_lang("en_US.UTF-8")
+    grid = np.zeros((10, 10), dtype=bool)
+    grid[4, 2:5] = True
+    state = RendererState.create(dimensions=(10, 10))
+
+    # When
+    render_grid_to_terminal(
+        mock_terminal, grid, RendererConfig(), state, create_metrics()
+    )
+
+    # Then
+    row_moves = [
+        y for _, y in mock_terminal.move_xy_calls if y < mock_terminal.height - 2
+    ]
+    assert len(row_moves) == 10
+    assert len(set(row_moves)) == 10
+
+
+def test_double_width_cells_get_their_own_cursor_move(
+    mock_terminal: MockTerminal, locale_lang: Callable[[str], None]
+) -> None:
+    """Given a CJK locale, where the default glyphs render double-width
+    When rendering a frame
+    Then every cell is positioned individually instead of batched
+    """
+    import numpy as np
+
+    # Given
+    locale_lang("ja_JP.UTF-8")
+    grid = np.zeros((10, 10), dtype=bool)
+    grid[4, 2:5] = True
+    state = RendererState.create(dimensions=(10, 10))
+
+    # When
+    render_grid_to_terminal(
+        mock_terminal, grid, RendererConfig(), state, create_metrics()
+    )
+
+    # Then
+    row_moves = [
+        pos for pos in mock_terminal.move_xy_calls if pos[1] < mock_terminal.height - 2
+    ]
+    assert len(row_moves) == 100
+    assert len(set(row_moves)) == 100
+
+
+def test_frame_is_written_in_one_write(
+    mock_terminal: MockTerminal, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Given a grid with live cells
+    When rendering a frame
+    Then the whole frame reaches stdout in a single write
+    """
+    import io
+    import sys
+
+    import numpy as np
+
+    # Given
+    grid = np.zeros((10, 10), dtype=bool)
+    grid[4, 2:5] = True
+    state = RendererState.create(dimensions=(10, 10))
+    writes: List[str] = []
+
+    class RecordingStdout(io.StringIO):
+        def write(self, text: str) -> int:
+            writes.append(text)
+            return len(text)
+
+    monkeypatch.setattr(sys, "stdout", RecordingStdout())
+
+    # When
+    render_grid_to_terminal(
+        mock_terminal, grid, RendererConfig(), state, create_metrics()
+    )
+
+    # Then
+    assert len(writes) == 1
+    assert "Population: 3" in strip_ansi(writes[0])
+
+
 def test_adaptive_frame_rate() -> None:
     """Test adaptive frame rate calculation.
 
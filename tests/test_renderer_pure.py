@@ -3,11 +3,21 @@
 Tests the pure computational functions extracted from the renderer module.
 """
 
+from unittest.mock import Mock, PropertyMock
+
 import numpy as np
 
 from gol.metrics import create_metrics
 from gol.patterns import PatternTransform
-from gol.renderer import calculate_pattern_cells, calculate_render_metrics
+from gol.renderer import (
+    RendererConfig,
+    TerminalProtocol,
+    build_cell_strings,
+    calculate_pattern_cells,
+    calculate_render_metrics,
+    cell_display_width,
+    is_live_cell,
+)
 from gol.types import RenderGrid
 
 
@@ -182,3 +192,78 @@ def test_calculate_pattern_cells_with_rotation() -> None:
     assert all(cell[0] == x_coord for cell in sorted_cells)
     y_coords = [cell[1] for cell in sorted_cells]
     assert y_coords == [y_coords[0] + i for i in range(3)]
+
+
+def test_calculate_render_metrics_with_array_previous_grid() -> None:
+    """Given the previous frame as a grid array
+    When calculating render metrics
+    Then should count births and deaths from the array directly
+    """
+    # Given
+    current_grid = np.array([[1, 0, 1], [0, 1, 0]], dtype=bool)
+    previous_grid = np.array([[0, 1, 1], [0, 0, 1]], dtype=bool)
+    metrics = create_metrics()
+
+    # When
+    new_metrics = calculate_render_metrics(current_grid, previous_grid, metrics)
+
+    # Then
+    assert new_metrics.game.births_this_second == 2
+    assert new_metrics.game.deaths_this_second == 2
+
+
+def test_is_live_cell_outside_grid() -> None:
+    """Given a grid with live cells at its corners
+    When checking cells on and off the grid
+    Then off-grid coordinates should read as dead instead of wrapping
+    """
+    # Given
+    grid = np.array([[1, 0], [0, 1]], dtype=bool)
+
+    # Then
+    assert is_live_cell(grid, 0, 0)
+    assert is_live_cell(grid, 1, 1)
+    assert not is_live_cell(grid, 1, 0)
+    assert not is_live_cell(grid, -1, -1)
+    assert not is_live_cell(grid, 2, 0)
+
+
+def test_build_cell_strings_covers_display_variants() -> None:
+    """Given a colored terminal and renderer config
+    When pre-formatting cell strings
+    Then each display variant maps to its styled string
+    And only dead cells keep their spacing dimmed
+    """
+    # Given
+    terminal = Mock(spec=TerminalProtocol)
+    for name in ("normal", "dim", "white", "blue", "yellow"):
+        setattr(type(terminal), name, PropertyMock(return_value=f"<{name}>"))
+    config = RendererConfig()
+
+    # When
+    cell_strings = build_cell_strings(terminal, config)
+
+    # Then
+    assert cell_strings[(config.cell_alive, "<white>")] == (
+        f"<white>{config.cell_alive}<normal>{config.cell_spacing}<normal>"
+    )
+    assert cell_strings[("+", "<yellow>")] == (
+        f"<yellow>+<normal>{config.cell_spacing}<normal>"
+    )
+    assert cell_strings[("◆", "<blue>")] == (
+        f"<blue>◆<normal>{config.cell_spacing}<normal>"
+    )
+    assert cell_strings[(config.cell_dead, "<dim>")] == (
+        f"<dim>{config.cell_dead}<dim>{config.cell_spacing}<normal>"
+    )
+
+
+def test_cell_display_width() -> None:
+    """Given cell texts of narrow, wide and combining characters
+    When estimating their terminal width
+    Then wide characters count two columns and combining marks none
+    """
+    # Given / When / Then
+    assert cell_display_width("o ") == 2
+    assert cell_display_width("中 ") == 3
+    assert cell_display_width("e\u0301 ") == 2
@@ -115,6 +115,23 @@ def test_parse_invalid_rle_pattern() -> None:
             parse_rle_pattern(invalid_pattern)
 
 
+@pytest.mark.filterwarnings("error::RuntimeWarning")
+@pytest.mark.parametrize(
+    "data",
+    ["1" + "0" * 400 + "o!", "1" + "0" * 400 + "b$o!"],
+    ids=["live-run", "dead-run"],
+)
+def test_parse_rle_pattern_with_overlong_run_count(data: str) -> None:
+    """Test parsing a run count far larger than the pattern.
+
+    Given: A run count with hundreds of digits
+    When: Parsing the pattern
+    Then: Should report the overflow as exceeding the width
+    """
+    with pytest.raises(RLEParseError, match="exceeds specified width"):
+        parse_rle_pattern(f"x = 3, y = 3\n{data}")
+
+
 def test_parse_rle_pattern_from_file(tmp_path: Path) -> None:
     """Test parsing RLE pattern from file.
 